@@ -18,48 +18,86 @@ Version: 1.0.0
 import os
 import sys
 import json
+import gzip
+import math
 import time
 import asyncio
+import functools
 import socket
 import struct
 import base64
+import hmac
+import hashlib
 import uuid
 import secrets
 import sqlite3
 import threading
 import logging
+import logging.handlers
 import subprocess
-from dataclasses import dataclass, asdict
+from collections import OrderedDict, deque
+from queue import SimpleQueue
+from dataclasses import dataclass, fields
+from enum import IntEnum
 from typing import Optional, List, Dict, Tuple, Any
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Core dependencies
-import geopandas as gpd
-import pandas as pd
-from shapely.geometry import Point, Polygon, LineString
+import shapely
+from shapely.geometry import LineString
 from shapely.ops import transform
 import pyproj
+import numpy as np
+import orjson
+import msgpack
 
 # Cryptography
 from nacl.public import PrivateKey, PublicKey, Box
 from nacl.signing import SigningKey, VerifyKey
 from nacl.secret import SecretBox
 from nacl.utils import random
-from nacl.encoding import Base64Encoder
+from nacl.encoding import Base64Encoder, RawEncoder
+from nacl.hash import blake2b
 from nacl.exceptions import BadSignatureError
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 
 # Web framework and real-time communication
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, Form, HTTPException, Depends
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import uvicorn
 
+# libuv-based event loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# C HTTP parser for uvicorn
+try:
+    import httptools
+    HTTPTOOLS_AVAILABLE = True
+except ImportError:
+    HTTPTOOLS_AVAILABLE = False
+
+# JIT compilation for geospatial kernels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Serial communication for LoRa
 try:
     import serial
+    from cobs import cobs
     LORA_AVAILABLE = True
 except ImportError:
     LORA_AVAILABLE = False
@@ -86,6 +124,63 @@ for directory in [MAPS_DIR, ATTACH_DIR, LOGS_DIR]:
 MESH_PORT = 47474
 BROADCAST_ADDR = "255.255.255.255"
 DEFAULT_INTERFACE = "bat0"  # BATMAN-adv interface
+MESH_RX_QUEUE_SIZE = 1024  # Received datagrams buffered per adapter
+LORA_FRAME_DELIMITER = b"\x00"  # COBS frame terminator on the serial link
+LORA_MAX_FRAME = 65536  # Discard partial frames growing beyond this size
+OUTBOX_BATCH_SIZE = 32  # Queued frames handed to transports per transmit cycle
+RX_DEDUP_CACHE_SIZE = 4096  # Verified (sender, msg_id) pairs remembered to drop relayed copies
+RX_MAX_IN_FLIGHT = 64  # Received frames decoded concurrently; receives pause beyond this
+
+# Wire protocol: msgpack frames carry a leading format byte; legacy JSON frames start with '{'
+WIRE_FORMAT_MSGPACK = b"\x02"  # Followed by sig_len (2B) | signature | signed msgpack envelope
+SESSION_ID_SIZE = 8  # Random per-process id carried in every msgpack envelope
+MSG_TYPE_KEY_ACK = "KEY_ACK"  # MAC'd handshake: the sender holds our key in its current session
+
+# Cryptographic configuration
+def _cpu_flags() -> set:
+    """Read CPU feature flags (x86 'flags' / ARM 'Features') from /proc/cpuinfo"""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key.strip() in ('flags', 'Features'):
+                    return set(value.split())
+    except OSError:
+        pass
+    return set()
+
+CPU_FLAGS = _cpu_flags()
+AES_HW_AVAILABLE = "aes" in CPU_FLAGS  # AES-NI / ARMv8 crypto extensions
+
+BOX_CACHE_SIZE = 256  # Per-peer shared-secret Box objects kept in memory
+PEER_CACHE_SIZE = 256  # Pinned peer identities (Ed25519-verified) kept in memory
+VERIFY_KEY_CACHE_SIZE = 1024  # Parsed peer Ed25519 verify keys kept in memory
+CIPHER_XSALSA20 = b"\x01"  # NaCl Box (XSalsa20-Poly1305), software fallback
+CIPHER_AES_GCM = b"\x02"   # AES-256-GCM via OpenSSL, hardware accelerated
+AES_GCM_NONCE_SIZE = 12  # Random 96-bit nonce per message
+SIG_ED25519 = b"\x01"  # Ed25519 signature, used for broadcast and first contact
+SIG_BLAKE2B = b"\x02"  # Keyed Blake2b MAC for unicast to an authenticated peer
+MAC_DIGEST_SIZE = 32
+
+# Database connection
+DB_CACHED_STATEMENTS = 256  # Prepared statements kept by the shared connection
+DB_FETCH_BATCH_SIZE = 256  # Rows fetched per step when streaming large result sets
+
+# Database write batching
+DB_FLUSH_INTERVAL = 0.05  # Seconds between background flushes
+DB_FLUSH_BATCH_SIZE = 128  # Buffered rows that trigger an immediate flush
+
+# Geofencing
+GEOFENCE_RELOAD_INTERVAL = 30.0  # Seconds before cached zones are re-read from the database
+
+# Web clients
+WS_SEND_TIMEOUT = 0.5  # Seconds a dashboard may stall a single send before it is dropped
+WS_CLIENT_QUEUE_SIZE = 32  # Pending frames per dashboard before it is dropped as too slow
+TACTICAL_PICTURE_TTL = 1.0  # Seconds an encoded tactical picture is shared between requests
+ACTIVE_NODES_TTL = 1.0  # Seconds an encoded active node list is shared between requests
+DASHBOARD_PUSH_INTERVAL = 5.0  # Max seconds between delta checks, so expired nodes are pruned
+WS_MAX_FRAME_SIZE = 2 ** 20  # Largest inbound dashboard frame (bytes) the server will buffer
+MESSAGES_STREAM_THRESHOLD = 1000  # /api/messages limits above this are streamed row batch by batch
 
 # Message topics (military standard)
 TOPIC_BLUE_FORCE = "blue_force"
@@ -100,6 +195,35 @@ TOPIC_COMMAND = "command"
 TOPIC_ALERT = "alert"
 TOPIC_FILE = "file_transfer"
 
+class Topic(IntEnum):
+    """Wire codes for the standard topics (member name is the upper-cased topic)"""
+    BLUE_FORCE = 1
+    RED_FORCE = 2
+    NEUTRAL = 3
+    INTEL = 4
+    SITREP = 5
+    MEDEVAC = 6
+    SUPPLIES = 7
+    FIRES = 8
+    COMMAND = 9
+    ALERT = 10
+    FILE_TRANSFER = 11
+
+class Classification(IntEnum):
+    """Wire codes for the standard classification markings"""
+    UNCLASSIFIED = 0
+    CUI = 1
+    CONFIDENTIAL = 2
+    SECRET = 3
+    TOP_SECRET = 4
+
+# Topic/classification strings <-> integer wire codes; other values travel as text
+# (interned, so decoded topics are the same objects as the TOPIC_* constants)
+TOPIC_WIRE_CODES = {sys.intern(topic.name.lower()): int(topic) for topic in Topic}
+TOPIC_WIRE_NAMES = {code: name for name, code in TOPIC_WIRE_CODES.items()}
+CLASSIFICATION_WIRE_CODES = {sys.intern(level.name): int(level) for level in Classification}
+CLASSIFICATION_WIRE_NAMES = {code: name for name, code in CLASSIFICATION_WIRE_CODES.items()}
+
 # Military grid reference system
 MGRS_ZONES = ["32T", "32U", "33T", "33U"]
 
@@ -131,6 +255,17 @@ class NodeIdentity:
     verify_key: str
     created: float
 
+    def to_row(self, last_seen: float) -> tuple:
+        """Row tuple in nodes-table column order"""
+        return (self.node_id, self.callsign, self.unit, self.rank, self.role,
+                self.clearance_level, self.pubkey, self.verify_key, last_seen, self.created)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat field dict (cheaper than dataclasses.asdict)"""
+        return {"node_id": self.node_id, "callsign": self.callsign, "unit": self.unit,
+                "rank": self.rank, "role": self.role, "clearance_level": self.clearance_level,
+                "pubkey": self.pubkey, "verify_key": self.verify_key, "created": self.created}
+
 @dataclass
 class Position:
     """Geospatial position data"""
@@ -144,6 +279,19 @@ class Position:
     timestamp: float
     mgrs: str = ""
 
+    def to_row(self) -> tuple:
+        """Row tuple in positions-table column order"""
+        return (self.node_id, self.lat, self.lon, self.alt, self.accuracy,
+                self.speed, self.course, self.mgrs, self.timestamp)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat field dict (cheaper than dataclasses.asdict)"""
+        return {"node_id": self.node_id, "lat": self.lat, "lon": self.lon, "alt": self.alt,
+                "accuracy": self.accuracy, "speed": self.speed, "course": self.course,
+                "timestamp": self.timestamp, "mgrs": self.mgrs}
+
+POSITION_FIELDS = tuple(f.name for f in fields(Position))
+
 @dataclass
 class TacticalMessage:
     """Military tactical message format"""
@@ -158,7 +306,26 @@ class TacticalMessage:
     expires: Optional[float]
     payload: Dict[str, Any]
     attachments: List[str]
-    signature: Optional[str] = None
+    signature: Optional[bytes] = None
+
+    @property
+    def signature_b64(self) -> Optional[str]:
+        """Signature as base64 text for storage and web clients"""
+        return base64.b64encode(self.signature).decode() if self.signature else None
+
+    def to_row(self) -> tuple:
+        """Row tuple in messages-table column order"""
+        return (self.msg_id, self.msg_type, self.topic, self.sender, orjson.dumps(self.recipients),
+                self.classification, self.priority, self.timestamp, self.expires,
+                orjson.dumps(self.payload), orjson.dumps(self.attachments), self.signature_b64)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat field dict sharing payload/list objects (cheaper than dataclasses.asdict)"""
+        return {"msg_id": self.msg_id, "msg_type": self.msg_type, "topic": self.topic,
+                "sender": self.sender, "recipients": self.recipients,
+                "classification": self.classification, "priority": self.priority,
+                "timestamp": self.timestamp, "expires": self.expires, "payload": self.payload,
+                "attachments": self.attachments, "signature": self.signature}
 
 @dataclass
 class GeofenceZone:
@@ -172,10 +339,99 @@ class GeofenceZone:
     created: float
     active: bool = True
 
+# =============================================================================
+# GEOSPATIAL KERNELS
+# =============================================================================
+
+EARTH_RADIUS_KM = 6371.0
+
+def _haversine_matrix_kernel(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Pairwise great-circle distances in km (loop form for Numba)"""
+    n = lat.shape[0]
+    out = np.empty((n, n), dtype=np.float64)
+    for i in prange(n):
+        phi1 = math.radians(lat[i])
+        lam1 = math.radians(lon[i])
+        cos_phi1 = math.cos(phi1)
+        for j in range(n):
+            phi2 = math.radians(lat[j])
+            dphi = phi2 - phi1
+            dlam = math.radians(lon[j]) - lam1
+            a = math.sin(dphi / 2) ** 2 + cos_phi1 * math.cos(phi2) * math.sin(dlam / 2) ** 2
+            out[i, j] = 2.0 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+    return out
+
+def _haversine_matrix_numpy(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Pairwise great-circle distances in km (vectorized NumPy fallback)"""
+    phi = np.radians(lat)
+    lam = np.radians(lon)
+    dphi = phi[np.newaxis, :] - phi[:, np.newaxis]
+    dlam = lam[np.newaxis, :] - lam[:, np.newaxis]
+    a = np.sin(dphi / 2) ** 2 + np.outer(np.cos(phi), np.cos(phi)) * np.sin(dlam / 2) ** 2
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+def _mgrs_grid_zones_kernel(lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """UTM zone numbers and latitude band letter codes (loop form for Numba)"""
+    n = lat.shape[0]
+    zones = np.empty(n, dtype=np.int64)
+    letters = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        zones[i] = int((lon[i] + 180.0) / 6.0) + 1
+        letters[i] = ord('C') + int((lat[i] + 80.0) / 8.0)
+    return zones, letters
+
+def _mgrs_grid_zones_numpy(lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """UTM zone numbers and latitude band letter codes (vectorized NumPy fallback)"""
+    zones = ((lon + 180.0) / 6.0).astype(np.int64) + 1
+    letters = ((lat + 80.0) / 8.0).astype(np.int64) + ord('C')
+    return zones, letters
+
+def _mgrs_grid_zone_scalar(lat: float, lon: float) -> Tuple[int, int]:
+    """UTM zone number and latitude band letter code for a single point"""
+    return int((lon + 180.0) / 6.0) + 1, ord('C') + int((lat + 80.0) / 8.0)
+
+if NUMBA_AVAILABLE:
+    haversine_matrix = njit(cache=True, parallel=True)(_haversine_matrix_kernel)
+    mgrs_grid_zones = njit(cache=True, parallel=True)(_mgrs_grid_zones_kernel)
+    mgrs_grid_zone = njit(cache=True)(_mgrs_grid_zone_scalar)
+else:
+    haversine_matrix = _haversine_matrix_numpy
+    mgrs_grid_zones = _mgrs_grid_zones_numpy
+    mgrs_grid_zone = _mgrs_grid_zone_scalar
+
+def format_mgrs(lat: np.ndarray, lon: np.ndarray) -> List[str]:
+    """Batch lat/lon to simplified MGRS grid zone designators"""
+    zones, letters = mgrs_grid_zones(lat, lon)
+    return [f"{zone}{chr(letter)}" for zone, letter in zip(zones.tolist(), letters.tolist())]
+
 # =============================================================================
 # CRYPTOGRAPHIC SECURITY MODULE
 # =============================================================================
 
+@functools.lru_cache(maxsize=VERIFY_KEY_CACHE_SIZE)
+def _load_verify_key(public_key: str) -> VerifyKey:
+    """Parse a base64 verify key once (thread-safe cache; verification runs on the executor)"""
+    return VerifyKey(base64.b64decode(public_key))
+
+class _NonceStream:
+    """Userspace nonce source: ChaCha20 keystream seeded once from the OS CSPRNG"""
+
+    CHUNK_SIZE = 4096
+
+    def __init__(self):
+        self._keystream = Cipher(algorithms.ChaCha20(random(32), random(16)), mode=None).encryptor()
+        self._buffer = b""
+        self._offset = 0
+
+    def take(self, size: int) -> bytes:
+        """Return the next `size` bytes, refilling in CHUNK_SIZE blocks"""
+        if self._offset + size > len(self._buffer):
+            self._buffer = self._keystream.update(bytes(self.CHUNK_SIZE))
+            self._offset = 0
+        nonce = self._buffer[self._offset:self._offset + size]
+        self._offset += size
+        return nonce
+
 class MilitaryCrypto:
     """Military-grade encryption and key management"""
 
@@ -183,6 +439,20 @@ class MilitaryCrypto:
         self.keys = self._load_or_generate_keys()
         self.session_keys: Dict[str, SecretBox] = {}
 
+        # Decode private key material once; it is immutable after load
+        self._signing_key = SigningKey(base64.b64decode(self.keys["sig_private"]))
+        self._enc_private = PrivateKey(base64.b64decode(self.keys["enc_private"]))
+
+        # Per-peer Box cache (each Box costs one X25519 scalar multiplication)
+        self._box_cache: "OrderedDict[str, Box]" = OrderedDict()
+
+        # Per-peer (send, receive) AES-GCM ciphers keyed off the Box shared secret
+        self._aead_cache: "OrderedDict[str, Tuple[AESGCM, AESGCM]]" = OrderedDict()
+        self._mac_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+        # AES-GCM and XSalsa20 nonces come from userspace instead of one getrandom() per message
+        self._nonce_stream = _NonceStream()
+
     def _load_or_generate_keys(self) -> Dict[str, str]:
         """Load existing keys or generate new military-grade keypair"""
         if KEY_PATH.exists():
@@ -216,33 +486,127 @@ class MilitaryCrypto:
 
         return keys
 
-    def sign_message(self, data: bytes) -> str:
+    def _get_box(self, peer_public_key: str) -> Box:
+        """Get cached Box for peer, deriving the shared secret on first use"""
+        box = self._box_cache.get(peer_public_key)
+        if box is not None:
+            self._box_cache.move_to_end(peer_public_key)
+            return box
+
+        box = Box(self._enc_private, PublicKey(base64.b64decode(peer_public_key)))
+        self._box_cache[peer_public_key] = box
+        if len(self._box_cache) > BOX_CACHE_SIZE:
+            self._box_cache.popitem(last=False)
+        return box
+
+    def _get_aead(self, peer_public_key: str) -> Tuple[AESGCM, AESGCM]:
+        """Get cached (send, receive) AES-GCM ciphers for peer"""
+        aead = self._aead_cache.get(peer_public_key)
+        if aead is not None:
+            self._aead_cache.move_to_end(peer_public_key)
+            return aead
+
+        # Derive one key per direction so both peers never share a nonce space
+        shared_key = self._get_box(peer_public_key).shared_key()
+        own_key = bytes(self._enc_private.public_key)
+        peer_key = base64.b64decode(peer_public_key)
+        aead = (
+            AESGCM(self._derive_session_key(shared_key, own_key + peer_key)),
+            AESGCM(self._derive_session_key(shared_key, peer_key + own_key))
+        )
+        self._aead_cache[peer_public_key] = aead
+        if len(self._aead_cache) > BOX_CACHE_SIZE:
+            self._aead_cache.popitem(last=False)
+        return aead
+
+    def _get_mac_key(self, peer_public_key: str) -> bytes:
+        """Get cached Blake2b MAC key shared with peer (same key in both directions)"""
+        mac_key = self._mac_cache.get(peer_public_key)
+        if mac_key is not None:
+            self._mac_cache.move_to_end(peer_public_key)
+            return mac_key
+
+        shared_key = self._get_box(peer_public_key).shared_key()
+        own_key = bytes(self._enc_private.public_key)
+        peer_key = base64.b64decode(peer_public_key)
+        context = min(own_key, peer_key) + max(own_key, peer_key)
+        mac_key = self._derive_session_key(shared_key, context, b"tactimesh-blake2b-mac")
+        self._mac_cache[peer_public_key] = mac_key
+        if len(self._mac_cache) > BOX_CACHE_SIZE:
+            self._mac_cache.popitem(last=False)
+        return mac_key
+
+    @staticmethod
+    def _derive_session_key(shared_key: bytes, context: bytes,
+                            label: bytes = b"tactimesh-aes-gcm") -> bytes:
+        """Derive a 256-bit symmetric key from the Curve25519 shared secret"""
+        hkdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=None,
+                    info=label + context)
+        return hkdf.derive(shared_key)
+
+    def _next_nonce(self) -> bytes:
+        """Generate a fully random 96-bit AES-GCM nonce
+
+        Session keys are static across restarts (HKDF without a per-session salt),
+        so a counter restarting at 1 would repeat nonces whenever a random prefix
+        collides; 96 random bits per message keep nonces unique under one key.
+        """
+        return self._nonce_stream.take(AES_GCM_NONCE_SIZE)
+
+    def sign_message(self, data: bytes) -> bytes:
         """Sign message with private key"""
         try:
-            signing_key = SigningKey(base64.b64decode(self.keys["sig_private"]))
-            signature = signing_key.sign(data).signature
-            return base64.b64encode(signature).decode()
+            return SIG_ED25519 + self._signing_key.sign(data).signature
         except Exception as e:
             logger.error(f"Message signing failed: {e}")
             raise
 
-    def verify_signature(self, data: bytes, signature: str, public_key: str) -> bool:
+    def mac_message(self, data: bytes, peer_public_key: str) -> bytes:
+        """Authenticate message for a single peer with a keyed Blake2b MAC"""
+        try:
+            digest = blake2b(data, digest_size=MAC_DIGEST_SIZE,
+                             key=self._get_mac_key(peer_public_key), encoder=RawEncoder)
+            return SIG_BLAKE2B + digest
+        except Exception as e:
+            logger.error(f"Message MAC failed: {e}")
+            raise
+
+    @staticmethod
+    def is_mac(signature: bytes) -> bool:
+        """Check whether a signature field carries a Blake2b MAC"""
+        return len(signature) == MAC_DIGEST_SIZE + 1 and signature[:1] == SIG_BLAKE2B
+
+    def verify_signature(self, data: bytes, signature: bytes, public_key: str) -> bool:
         """Verify message signature"""
         try:
-            verify_key = VerifyKey(base64.b64decode(public_key))
-            verify_key.verify(data, base64.b64decode(signature))
+            if len(signature) == 65 and signature[:1] == SIG_ED25519:
+                signature = signature[1:]  # Untagged 64-byte signatures come from older nodes
+            _load_verify_key(public_key).verify(data, signature)
             return True
         except (BadSignatureError, Exception) as e:
             logger.warning(f"Signature verification failed: {e}")
             return False
 
+    def verify_mac(self, data: bytes, signature: bytes, peer_public_key: str) -> bool:
+        """Verify Blake2b MAC from peer"""
+        try:
+            expected = blake2b(data, digest_size=MAC_DIGEST_SIZE,
+                               key=self._get_mac_key(peer_public_key), encoder=RawEncoder)
+            return hmac.compare_digest(signature[1:], expected)
+        except Exception as e:
+            logger.warning(f"MAC verification failed: {e}")
+            return False
+
     def encrypt_message(self, data: bytes, recipient_public_key: str) -> bytes:
         """Encrypt message for specific recipient"""
         try:
-            private_key = PrivateKey(base64.b64decode(self.keys["enc_private"]))
-            public_key = PublicKey(base64.b64decode(recipient_public_key))
-            box = Box(private_key, public_key)
-            return box.encrypt(data)
+            if AES_HW_AVAILABLE:
+                send_cipher, _ = self._get_aead(recipient_public_key)
+                nonce = self._next_nonce()
+                return CIPHER_AES_GCM + nonce + send_cipher.encrypt(nonce, data, None)
+
+            nonce = self._nonce_stream.take(Box.NONCE_SIZE)
+            return CIPHER_XSALSA20 + self._get_box(recipient_public_key).encrypt(data, nonce)
         except Exception as e:
             logger.error(f"Message encryption failed: {e}")
             raise
@@ -250,10 +614,14 @@ class MilitaryCrypto:
     def decrypt_message(self, encrypted_data: bytes, sender_public_key: str) -> bytes:
         """Decrypt message from sender"""
         try:
-            private_key = PrivateKey(base64.b64decode(self.keys["enc_private"]))
-            public_key = PublicKey(base64.b64decode(sender_public_key))
-            box = Box(private_key, public_key)
-            return box.decrypt(encrypted_data)
+            cipher = encrypted_data[:1]
+            if cipher == CIPHER_AES_GCM:
+                _, receive_cipher = self._get_aead(sender_public_key)
+                nonce_end = 1 + AES_GCM_NONCE_SIZE
+                return receive_cipher.decrypt(encrypted_data[1:nonce_end], encrypted_data[nonce_end:], None)
+            if cipher == CIPHER_XSALSA20:
+                return self._get_box(sender_public_key).decrypt(encrypted_data[1:])
+            raise ValueError(f"Unknown cipher suite: {cipher!r}")
         except Exception as e:
             logger.error(f"Message decryption failed: {e}")
             raise
@@ -262,149 +630,381 @@ class MilitaryCrypto:
 # DATABASE & PERSISTENCE LAYER
 # =============================================================================
 
+# SQL statements are module constants so the per-connection statement cache is reused
+_SQL_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS nodes (
+        node_id TEXT PRIMARY KEY,
+        callsign TEXT NOT NULL,
+        unit TEXT NOT NULL,
+        rank TEXT NOT NULL,
+        role TEXT NOT NULL,
+        clearance_level INTEGER NOT NULL,
+        pubkey TEXT NOT NULL,
+        verify_key TEXT NOT NULL,
+        last_seen REAL NOT NULL,
+        status TEXT DEFAULT 'ACTIVE',
+        created REAL NOT NULL
+    );
+
+    CREATE TABLE IF NOT EXISTS positions (
+        node_id TEXT PRIMARY KEY,
+        lat REAL NOT NULL,
+        lon REAL NOT NULL,
+        alt REAL NOT NULL,
+        accuracy REAL NOT NULL,
+        speed REAL NOT NULL,
+        course REAL NOT NULL,
+        mgrs TEXT NOT NULL,
+        timestamp REAL NOT NULL,
+        FOREIGN KEY (node_id) REFERENCES nodes(node_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS messages (
+        msg_id TEXT PRIMARY KEY,
+        msg_type TEXT NOT NULL,
+        topic TEXT NOT NULL,
+        sender TEXT NOT NULL,
+        recipients BLOB NOT NULL,  -- JSON array (UTF-8 bytes)
+        classification TEXT NOT NULL,
+        priority INTEGER NOT NULL,
+        timestamp REAL NOT NULL,
+        expires REAL,
+        payload BLOB NOT NULL,     -- JSON (UTF-8 bytes)
+        attachments BLOB,          -- JSON array (UTF-8 bytes)
+        signature TEXT,
+        delivered BOOLEAN DEFAULT FALSE,
+        acknowledged BOOLEAN DEFAULT FALSE
+    );
+
+    CREATE TABLE IF NOT EXISTS geofences (
+        zone_id TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        zone_type TEXT NOT NULL,
+        polygon TEXT NOT NULL,     -- WKT format
+        classification TEXT NOT NULL,
+        created_by TEXT NOT NULL,
+        created REAL NOT NULL,
+        active BOOLEAN DEFAULT TRUE
+    );
+
+    CREATE TABLE IF NOT EXISTS files (
+        file_id TEXT PRIMARY KEY,
+        filename TEXT NOT NULL,
+        file_path TEXT NOT NULL,
+        file_size INTEGER NOT NULL,
+        file_hash TEXT NOT NULL,
+        classification TEXT NOT NULL,
+        uploaded_by TEXT NOT NULL,
+        uploaded REAL NOT NULL
+    );
+
+    DROP INDEX IF EXISTS idx_messages_timestamp;
+    DROP INDEX IF EXISTS idx_messages_topic;
+    -- Covering the message-list summary columns, so fields=short never touches the table
+    CREATE INDEX IF NOT EXISTS idx_messages_list ON messages(topic, timestamp DESC, sender, priority, msg_id);
+    CREATE INDEX IF NOT EXISTS idx_messages_ts_list ON messages(timestamp DESC, topic, sender, priority, msg_id);
+    CREATE INDEX IF NOT EXISTS idx_positions_timestamp ON positions(timestamp);
+    CREATE INDEX IF NOT EXISTS idx_nodes_unit ON nodes(unit);
+    CREATE INDEX IF NOT EXISTS idx_nodes_active ON nodes(status, last_seen DESC);
+"""
+
+_SQL_UPSERT_NODE = """
+    INSERT INTO nodes
+    (node_id, callsign, unit, rank, role, clearance_level, pubkey, verify_key, last_seen, created)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(node_id) DO UPDATE SET
+        callsign = excluded.callsign, unit = excluded.unit, rank = excluded.rank,
+        role = excluded.role, clearance_level = excluded.clearance_level,
+        pubkey = excluded.pubkey, verify_key = excluded.verify_key,
+        last_seen = excluded.last_seen, created = excluded.created
+    WHERE excluded.last_seen > nodes.last_seen
+"""
+
+_SQL_UPSERT_POSITION = """
+    INSERT INTO positions
+    (node_id, lat, lon, alt, accuracy, speed, course, mgrs, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(node_id) DO UPDATE SET
+        lat = excluded.lat, lon = excluded.lon, alt = excluded.alt,
+        accuracy = excluded.accuracy, speed = excluded.speed,
+        course = excluded.course, mgrs = excluded.mgrs, timestamp = excluded.timestamp
+    WHERE excluded.timestamp > positions.timestamp
+"""
+
+_SQL_INSERT_MESSAGE = """
+    INSERT OR REPLACE INTO messages
+    (msg_id, msg_type, topic, sender, recipients, classification, priority,
+     timestamp, expires, payload, attachments, signature)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_ACTIVE_NODES = """
+    SELECT node_id, callsign, unit, rank, role, clearance_level,
+           pubkey, verify_key, created
+    FROM nodes
+    WHERE last_seen > ? AND status = 'ACTIVE'
+    ORDER BY last_seen DESC
+"""
+
+_SQL_CURRENT_POSITIONS = """
+    SELECT p.node_id, p.lat, p.lon, p.alt, p.accuracy, p.speed, p.course, p.timestamp, p.mgrs
+    FROM positions p
+    JOIN nodes n ON p.node_id = n.node_id
+    WHERE p.timestamp > ? AND n.status = 'ACTIVE'
+    ORDER BY p.timestamp DESC
+"""
+
+_SQL_MESSAGES = """
+    SELECT msg_id, msg_type, topic, sender, recipients, classification,
+           priority, timestamp, payload, attachments
+    FROM messages
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_MESSAGES_BY_TOPIC = """
+    SELECT msg_id, msg_type, topic, sender, recipients, classification,
+           priority, timestamp, payload, attachments
+    FROM messages
+    WHERE topic = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_MESSAGE_SUMMARIES = """
+    SELECT msg_id, sender, topic, timestamp, priority
+    FROM messages
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_MESSAGE_SUMMARIES_BY_TOPIC = """
+    SELECT msg_id, sender, topic, timestamp, priority
+    FROM messages
+    WHERE topic = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_RESTRICTED_GEOFENCES = """
+    SELECT zone_id, name, zone_type, polygon, classification
+    FROM geofences
+    WHERE active = TRUE AND zone_type IN ('HOSTILE', 'RESTRICTED')
+"""
+
+def _message_rows_to_dicts(rows) -> List[Dict[str, Any]]:
+    """Message rows to API dicts (JSON columns as orjson.Fragment)"""
+    # JSON columns were written by orjson, so they are spliced into the
+    # response as-is; rows stream straight off the cursor into dicts
+    return [{
+        'msg_id': msg_id,
+        'msg_type': msg_type,
+        'topic': msg_topic,
+        'sender': sender,
+        'recipients': orjson.Fragment(recipients),
+        'classification': classification,
+        'priority': priority,
+        'timestamp': timestamp,
+        'payload': orjson.Fragment(payload),
+        'attachments': orjson.Fragment(attachments) if attachments else []
+    } for (msg_id, msg_type, msg_topic, sender, recipients, classification,
+           priority, timestamp, payload, attachments) in rows]
+
 class TacticalDatabase:
     """SQLite database for tactical data persistence"""
 
     def __init__(self, db_path: Path):
         self.db_path = db_path
+
+        # Single persistent connection shared by all callers, guarded by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None,
+                                     cached_statements=DB_CACHED_STATEMENTS)
+
+        # Write buffers for high-rate inserts, flushed in batches (nodes keep
+        # only their latest row)
+        self._node_buffer: Dict[str, tuple] = {}
+        self._pos_buffer: List[tuple] = []
+        self._msg_buffer: List[tuple] = []
+
+        self._configure_connection()
         self._initialize_database()
 
+    def _configure_connection(self):
+        """Apply journaling and caching pragmas"""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA mmap_size=268435456")
+            self._conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+
     def _initialize_database(self):
         """Create database tables"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS nodes (
-                    node_id TEXT PRIMARY KEY,
-                    callsign TEXT NOT NULL,
-                    unit TEXT NOT NULL,
-                    rank TEXT NOT NULL,
-                    role TEXT NOT NULL,
-                    clearance_level INTEGER NOT NULL,
-                    pubkey TEXT NOT NULL,
-                    verify_key TEXT NOT NULL,
-                    last_seen REAL NOT NULL,
-                    status TEXT DEFAULT 'ACTIVE',
-                    created REAL NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS positions (
-                    node_id TEXT PRIMARY KEY,
-                    lat REAL NOT NULL,
-                    lon REAL NOT NULL,
-                    alt REAL NOT NULL,
-                    accuracy REAL NOT NULL,
-                    speed REAL NOT NULL,
-                    course REAL NOT NULL,
-                    mgrs TEXT NOT NULL,
-                    timestamp REAL NOT NULL,
-                    FOREIGN KEY (node_id) REFERENCES nodes(node_id)
-                );
-
-                CREATE TABLE IF NOT EXISTS messages (
-                    msg_id TEXT PRIMARY KEY,
-                    msg_type TEXT NOT NULL,
-                    topic TEXT NOT NULL,
-                    sender TEXT NOT NULL,
-                    recipients TEXT NOT NULL,  -- JSON array
-                    classification TEXT NOT NULL,
-                    priority INTEGER NOT NULL,
-                    timestamp REAL NOT NULL,
-                    expires REAL,
-                    payload TEXT NOT NULL,     -- JSON
-                    attachments TEXT,          -- JSON array
-                    signature TEXT,
-                    delivered BOOLEAN DEFAULT FALSE,
-                    acknowledged BOOLEAN DEFAULT FALSE
-                );
-
-                CREATE TABLE IF NOT EXISTS geofences (
-                    zone_id TEXT PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    zone_type TEXT NOT NULL,
-                    polygon TEXT NOT NULL,     -- WKT format
-                    classification TEXT NOT NULL,
-                    created_by TEXT NOT NULL,
-                    created REAL NOT NULL,
-                    active BOOLEAN DEFAULT TRUE
-                );
-
-                CREATE TABLE IF NOT EXISTS files (
-                    file_id TEXT PRIMARY KEY,
-                    filename TEXT NOT NULL,
-                    file_path TEXT NOT NULL,
-                    file_size INTEGER NOT NULL,
-                    file_hash TEXT NOT NULL,
-                    classification TEXT NOT NULL,
-                    uploaded_by TEXT NOT NULL,
-                    uploaded REAL NOT NULL
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_messages_timestamp ON messages(timestamp);
-                CREATE INDEX IF NOT EXISTS idx_messages_topic ON messages(topic);
-                CREATE INDEX IF NOT EXISTS idx_positions_timestamp ON positions(timestamp);
-                CREATE INDEX IF NOT EXISTS idx_nodes_unit ON nodes(unit);
-            """)
+        with self._lock:
+            self._conn.executescript(_SQL_SCHEMA)
 
     def upsert_node(self, node: NodeIdentity):
-        """Insert or update node information"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO nodes 
-                (node_id, callsign, unit, rank, role, clearance_level, pubkey, verify_key, last_seen, created)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (node.node_id, node.callsign, node.unit, node.rank, node.role, 
-                  node.clearance_level, node.pubkey, node.verify_key, time.time(), node.created))
+        """Insert or update node information (buffered until the next flush)"""
+        with self._lock:
+            self._node_buffer[node.node_id] = node.to_row(time.time())
+            self._maybe_flush()
 
     def upsert_position(self, position: Position):
-        """Insert or update position data"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO positions 
-                (node_id, lat, lon, alt, accuracy, speed, course, mgrs, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (position.node_id, position.lat, position.lon, position.alt,
-                  position.accuracy, position.speed, position.course, position.mgrs, position.timestamp))
+        """Insert or update position data (buffered until the next flush)"""
+        with self._lock:
+            self._pos_buffer.append(position.to_row())
+            self._maybe_flush()
 
     def store_message(self, message: TacticalMessage):
-        """Store tactical message"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO messages 
-                (msg_id, msg_type, topic, sender, recipients, classification, priority, 
-                 timestamp, expires, payload, attachments, signature)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (message.msg_id, message.msg_type, message.topic, message.sender,
-                  json.dumps(message.recipients), message.classification, message.priority,
-                  message.timestamp, message.expires, json.dumps(message.payload),
-                  json.dumps(message.attachments), message.signature))
+        """Store tactical message (buffered until the next flush)"""
+        with self._lock:
+            self._msg_buffer.append(message.to_row())
+            self._maybe_flush()
+
+    def _maybe_flush(self):
+        """Flush once enough rows are buffered (caller holds the lock)"""
+        if len(self._node_buffer) + len(self._pos_buffer) + len(self._msg_buffer) >= DB_FLUSH_BATCH_SIZE:
+            self._flush_buffers()
+
+    def flush(self):
+        """Write buffered nodes, positions and messages to disk"""
+        with self._lock:
+            self._flush_buffers()
+
+    def _flush_buffers(self):
+        """Write buffered node rows, then position and message rows (caller holds the lock)"""
+        if not self._node_buffer and not self._pos_buffer and not self._msg_buffer:
+            return
+
+        try:
+            # Sender rows come from verified identities; commit them apart from the
+            # remote-controlled payload rows so a bad payload never touches them
+            self._write_batches(((_SQL_UPSERT_NODE, list(self._node_buffer.values())),))
+            self._write_batches((
+                (_SQL_UPSERT_POSITION, self._pos_buffer),
+                (_SQL_INSERT_MESSAGE, self._msg_buffer)
+            ))
+        finally:
+            self._node_buffer.clear()
+            self._pos_buffer.clear()
+            self._msg_buffer.clear()
+
+    def _write_batches(self, batches):
+        """Write (sql, rows) batches in one transaction, row by row if it fails (caller holds the lock)"""
+        if not any(rows for _, rows in batches):
+            return
+
+        try:
+            self._conn.execute("BEGIN")
+            for sql, rows in batches:
+                if rows:
+                    self._conn.executemany(sql, rows)
+            self._conn.execute("COMMIT")
+        except Exception as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            logger.warning(f"Batched flush failed, retrying row by row: {e}")
+            self._write_rows_individually(batches)
+
+    def _write_rows_individually(self, batches):
+        """Write each row on its own so a bad row only loses itself (caller holds the lock)"""
+        for sql, rows in batches:
+            for row in rows:
+                try:
+                    self._conn.execute(sql, row)
+                except Exception as e:
+                    logger.error(f"Dropping unwritable row {row[0]!r}: {e}")
 
     def get_active_nodes(self, max_age_seconds: int = 300) -> List[NodeIdentity]:
         """Get nodes active within specified time"""
         cutoff_time = time.time() - max_age_seconds
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT node_id, callsign, unit, rank, role, clearance_level, 
-                       pubkey, verify_key, created
-                FROM nodes 
-                WHERE last_seen > ? AND status = 'ACTIVE'
-                ORDER BY last_seen DESC
-            """, (cutoff_time,))
+        with self._lock:
+            self._flush_buffers()
+            cursor = self._conn.execute(_SQL_ACTIVE_NODES, (cutoff_time,))
 
             return [NodeIdentity(*row) for row in cursor.fetchall()]
 
+    def get_messages(self, topic: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get most recent messages, newest first (JSON columns as orjson.Fragment)"""
+        with self._lock:
+            self._flush_buffers()
+            if topic:
+                cursor = self._conn.execute(_SQL_MESSAGES_BY_TOPIC, (topic, limit))
+            else:
+                cursor = self._conn.execute(_SQL_MESSAGES, (limit,))
+
+            return _message_rows_to_dicts(cursor)
+
+    def get_message_summaries(self, topic: Optional[str] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get most recent message headers only, answered from the covering indexes"""
+        with self._lock:
+            self._flush_buffers()
+            if topic:
+                cursor = self._conn.execute(_SQL_MESSAGE_SUMMARIES_BY_TOPIC, (topic, limit))
+            else:
+                cursor = self._conn.execute(_SQL_MESSAGE_SUMMARIES, (limit,))
+
+            return [{'msg_id': msg_id, 'sender': sender, 'topic': msg_topic,
+                     'timestamp': timestamp, 'priority': priority}
+                    for msg_id, sender, msg_topic, timestamp, priority in cursor]
+
+    def iter_message_batches(self, topic: Optional[str] = None, limit: int = 100):
+        """Yield recent messages in DB_FETCH_BATCH_SIZE batches from a private read-only connection"""
+        with self._lock:
+            self._flush_buffers()
+
+        # WAL lets this reader run alongside the shared connection without holding its lock
+        conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                               check_same_thread=False)
+        try:
+            if topic:
+                cursor = conn.execute(_SQL_MESSAGES_BY_TOPIC, (topic, limit))
+            else:
+                cursor = conn.execute(_SQL_MESSAGES, (limit,))
+            while True:
+                rows = cursor.fetchmany(DB_FETCH_BATCH_SIZE)
+                if not rows:
+                    break
+                yield _message_rows_to_dicts(rows)
+        finally:
+            conn.close()
+
+    def get_restricted_geofences(self) -> List[tuple]:
+        """Get active hostile/restricted zones as (zone_id, name, zone_type, wkt, classification) rows"""
+        with self._lock:
+            return self._conn.execute(_SQL_RESTRICTED_GEOFENCES).fetchall()
+
+    def get_current_positions_soa(self, max_age_seconds: int = 300) -> Dict[str, np.ndarray]:
+        """Get current positions as one array per Position field (struct-of-arrays)"""
+        cutoff_time = time.time() - max_age_seconds
+        with self._lock:
+            self._flush_buffers()
+            rows = self._conn.execute(_SQL_CURRENT_POSITIONS, (cutoff_time,)).fetchall()
+
+        columns = list(zip(*rows)) if rows else [()] * len(POSITION_FIELDS)
+        soa = {'node_id': np.array(columns[0], dtype=object)}
+        for name, values in zip(POSITION_FIELDS[1:-1], columns[1:-1]):
+            soa[name] = np.array(values, dtype=np.float64)
+        soa['mgrs'] = np.array(columns[-1], dtype=object)
+
+        # Fill in grid zones for positions reported without MGRS in one batch
+        missing = np.fromiter((not mgrs for mgrs in columns[-1]), dtype=bool, count=len(rows))
+        if missing.any():
+            soa['mgrs'][missing] = format_mgrs(soa['lat'][missing], soa['lon'][missing])
+
+        return soa
+
     def get_current_positions(self, max_age_seconds: int = 300) -> List[Position]:
         """Get current position data for active nodes"""
-        cutoff_time = time.time() - max_age_seconds
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT p.node_id, p.lat, p.lon, p.alt, p.accuracy, p.speed, p.course, p.mgrs, p.timestamp
-                FROM positions p
-                JOIN nodes n ON p.node_id = n.node_id
-                WHERE p.timestamp > ? AND n.status = 'ACTIVE'
-                ORDER BY p.timestamp DESC
-            """, (cutoff_time,))
+        soa = self.get_current_positions_soa(max_age_seconds)
+        return [Position(*row) for row in zip(*(soa[name].tolist() for name in POSITION_FIELDS))]
 
-            return [Position(*row) for row in cursor.fetchall()]
+    def close(self):
+        """Flush pending writes and close the database connection"""
+        with self._lock:
+            self._flush_buffers()
+            self._conn.close()
 
 # =============================================================================
 # MESH NETWORK TRANSPORT LAYER
@@ -416,6 +1016,11 @@ class MeshTransportAdapter:
     async def send_message(self, data: bytes, destination: Optional[str] = None):
         raise NotImplementedError
 
+    async def send_batch(self, frames: List[bytes]):
+        """Send several frames; adapters override this to coalesce writes"""
+        for data in frames:
+            await self.send_message(data)
+
     async def receive_message(self) -> Tuple[bytes, Optional[str]]:
         raise NotImplementedError
 
@@ -425,6 +1030,19 @@ class MeshTransportAdapter:
     async def stop(self):
         raise NotImplementedError
 
+class _MeshProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol feeding received packets to a BatmanAdvAdapter"""
+
+    def __init__(self, adapter: "BatmanAdvAdapter"):
+        self.adapter = adapter
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        self.adapter._rx_queue.append((data, addr[0]))
+        self.adapter._rx_event.set()
+
+    def error_received(self, exc: Exception):
+        logger.warning(f"BATMAN-adv socket error: {exc}")
+
 class BatmanAdvAdapter(MeshTransportAdapter):
     """BATMAN-adv mesh network adapter"""
 
@@ -432,7 +1050,10 @@ class BatmanAdvAdapter(MeshTransportAdapter):
         self.interface = interface
         self.port = port
         self.socket = None
+        self.transport: Optional[asyncio.DatagramTransport] = None
         self.running = False
+        self._rx_queue: deque = deque(maxlen=MESH_RX_QUEUE_SIZE)
+        self._rx_event: Optional[asyncio.Event] = None
 
     async def start(self):
         """Initialize BATMAN-adv transport"""
@@ -451,6 +1072,13 @@ class BatmanAdvAdapter(MeshTransportAdapter):
             self.socket.bind(('0.0.0.0', self.port))
             self.socket.setblocking(False)
 
+            # Drive the socket directly from the event loop (no executor hop per packet)
+            self._rx_event = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            self.transport, _ = await loop.create_datagram_endpoint(
+                lambda: _MeshProtocol(self), sock=self.socket
+            )
+
             self.running = True
             logger.info(f"BATMAN-adv adapter started on {self.interface}:{self.port}")
             return True
@@ -459,9 +1087,18 @@ class BatmanAdvAdapter(MeshTransportAdapter):
             logger.error(f"Failed to start BATMAN-adv adapter: {e}")
             return False
 
+    async def stop(self):
+        """Shut down BATMAN-adv transport"""
+        self.running = False
+        if self._rx_event:
+            self._rx_event.set()  # Release a pending receive_message()
+        if self.transport:
+            self.transport.close()
+            self.transport = None
+
     async def send_message(self, data: bytes, destination: Optional[str] = None):
         """Send message via BATMAN-adv mesh"""
-        if not self.socket or not self.running:
+        if not self.transport or not self.running:
             return
 
         try:
@@ -472,25 +1109,25 @@ class BatmanAdvAdapter(MeshTransportAdapter):
                 # Broadcast to all mesh nodes
                 addr = (BROADCAST_ADDR, self.port)
 
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.socket.sendto, data, addr)
+            self.transport.sendto(data, addr)
 
         except Exception as e:
             logger.error(f"Failed to send message via BATMAN-adv: {e}")
 
     async def receive_message(self) -> Tuple[bytes, Optional[str]]:
         """Receive message from BATMAN-adv mesh"""
-        if not self.socket or not self.running:
+        if not self.transport or not self.running:
             return b'', None
 
         try:
-            loop = asyncio.get_event_loop()
-            data, addr = await loop.run_in_executor(None, self.socket.recvfrom, 65535)
-            return data, addr[0]
+            # Block until the protocol signals a datagram (or stop() wakes us)
+            while not self._rx_queue:
+                self._rx_event.clear()
+                await self._rx_event.wait()
+                if not self.running:
+                    return b'', None
+            return self._rx_queue.popleft()
 
-        except socket.error:
-            await asyncio.sleep(0.01)
-            return b'', None
         except Exception as e:
             logger.error(f"Failed to receive message via BATMAN-adv: {e}")
             return b'', None
@@ -503,16 +1140,28 @@ class LoRaMeshAdapter(MeshTransportAdapter):
         self.baudrate = baudrate
         self.serial_conn = None
         self.running = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._rx_queue: Optional[asyncio.Queue] = None
+        self._reader_thread: Optional[threading.Thread] = None
 
     async def start(self):
         """Initialize LoRa mesh transport"""
         if not LORA_AVAILABLE:
-            logger.error("PySerial not available for LoRa adapter")
+            logger.error("PySerial/COBS not available for LoRa adapter")
             return False
 
         try:
             self.serial_conn = serial.Serial(self.port, self.baudrate, timeout=0.1)
+            self._loop = asyncio.get_running_loop()
+            self._rx_queue = asyncio.Queue(maxsize=MESH_RX_QUEUE_SIZE)
             self.running = True
+
+            # Blocking serial reads happen on a dedicated thread, not the event loop
+            self._reader_thread = threading.Thread(
+                target=self._reader_loop, name="lora-reader", daemon=True
+            )
+            self._reader_thread.start()
+
             logger.info(f"LoRa mesh adapter started on {self.port}")
             return True
 
@@ -520,32 +1169,88 @@ class LoRaMeshAdapter(MeshTransportAdapter):
             logger.error(f"Failed to start LoRa adapter: {e}")
             return False
 
+    async def stop(self):
+        """Shut down LoRa mesh transport"""
+        self.running = False
+        if self._rx_queue is not None:
+            try:
+                self._rx_queue.put_nowait(b'')  # Release a pending receive_message()
+            except asyncio.QueueFull:
+                pass
+        if self._reader_thread:
+            await self._loop.run_in_executor(None, self._reader_thread.join)
+            self._reader_thread = None
+        if self.serial_conn:
+            self.serial_conn.close()
+            self.serial_conn = None
+
+    def _reader_loop(self):
+        """Read COBS frames from the serial port (runs on the reader thread)"""
+        buffer = bytearray()
+        while self.running:
+            try:
+                chunk = self.serial_conn.read_until(LORA_FRAME_DELIMITER)
+                if not chunk:
+                    continue
+
+                # Accumulate partial frames until the delimiter arrives
+                buffer += chunk
+                if not chunk.endswith(LORA_FRAME_DELIMITER):
+                    if len(buffer) > LORA_MAX_FRAME:
+                        logger.warning("Discarding oversized LoRa frame")
+                        buffer.clear()
+                    continue
+
+                frame = bytes(buffer[:-1])
+                buffer.clear()
+                if frame:
+                    self._loop.call_soon_threadsafe(self._enqueue_frame, cobs.decode(frame))
+
+            except cobs.DecodeError as e:
+                logger.warning(f"Dropping malformed LoRa frame: {e}")
+            except Exception as e:
+                if self.running:
+                    logger.error(f"LoRa reader error: {e}")
+                    time.sleep(0.1)
+
+    def _enqueue_frame(self, data: bytes):
+        """Hand a decoded frame to the event loop (called via call_soon_threadsafe)"""
+        try:
+            self._rx_queue.put_nowait(data)
+        except asyncio.QueueFull:
+            logger.warning("LoRa receive queue full, dropping frame")
+
     async def send_message(self, data: bytes, destination: Optional[str] = None):
         """Send message via LoRa mesh"""
         if not self.serial_conn or not self.running:
             return
 
         try:
-            # Encode message as base64 and send as line
-            encoded = base64.b64encode(data).decode() + '\n'
-            self.serial_conn.write(encoded.encode())
+            # COBS-encode raw bytes (no zero bytes inside) and terminate with 0x00
+            self.serial_conn.write(cobs.encode(data) + LORA_FRAME_DELIMITER)
 
         except Exception as e:
             logger.error(f"Failed to send LoRa message: {e}")
 
+    async def send_batch(self, frames: List[bytes]):
+        """Send several frames via LoRa mesh in a single serial write"""
+        if not self.serial_conn or not self.running:
+            return
+
+        try:
+            self.serial_conn.write(b"".join(cobs.encode(data) + LORA_FRAME_DELIMITER for data in frames))
+
+        except Exception as e:
+            logger.error(f"Failed to send LoRa batch: {e}")
+
     async def receive_message(self) -> Tuple[bytes, Optional[str]]:
         """Receive message from LoRa mesh"""
         if not self.serial_conn or not self.running:
             return b'', None
 
         try:
-            line = self.serial_conn.readline()
-            if not line:
-                await asyncio.sleep(0.05)
-                return b'', None
-
-            # Decode base64 message
-            data = base64.b64decode(line.strip())
+            # Block until the reader thread hands over a frame (b'' on stop)
+            data = await self._rx_queue.get()
             return data, None  # LoRa doesn't provide source address
 
         except Exception as e:
@@ -556,6 +1261,69 @@ class LoRaMeshAdapter(MeshTransportAdapter):
 # TACTICAL MESH NODE
 # =============================================================================
 
+# Web client frames are MessagePack; only ever used from the event loop
+_ws_packer = msgpack.Packer(use_bin_type=True)
+
+def _etag(data: bytes, weak: bool = False) -> str:
+    """HTTP entity tag for an encoded body; weak when it covers only part of the response"""
+    tag = '"' + hashlib.blake2b(data, digest_size=16).hexdigest() + '"'
+    return "W/" + tag if weak else tag
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check using weak comparison (RFC 9110 13.1.2)"""
+    if_none_match = if_none_match.strip()
+    if if_none_match == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+class _PriorityOutbox:
+    """Outbox with one FIFO per priority class (0=FLASH ... 3=ROUTINE)"""
+
+    LEVELS = 4
+
+    def __init__(self):
+        self._queues = [deque() for _ in range(self.LEVELS)]
+        self._size = 0
+        self._ready = asyncio.Event()
+
+    def put(self, priority: int, item: Any):
+        """Queue item at priority, clamped to the valid range"""
+        self._queues[min(max(priority, 0), self.LEVELS - 1)].append(item)
+        self._size += 1
+        self._ready.set()
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def get_nowait(self) -> Any:
+        """Pop the oldest item of the most urgent non-empty priority class"""
+        for queue in self._queues:
+            if queue:
+                self._size -= 1
+                if not self._size:
+                    self._ready.clear()
+                return queue.popleft()
+        raise asyncio.QueueEmpty
+
+    async def get(self) -> Any:
+        while not self._size:
+            await self._ready.wait()
+        return self.get_nowait()
+
+@dataclass
+class _Peer:
+    """Pinned peer identity and the state of its MAC handshake"""
+    identity: NodeIdentity
+    session: Optional[bytes]  # Peer's per-process session id (None for legacy JSON frames)
+    mac_ready: bool = False   # Peer proved, in this session, that it holds our key
+
 class TactiMeshNode:
     """Main tactical mesh networking node"""
 
@@ -577,20 +1345,58 @@ class TactiMeshNode:
             created=self.crypto.keys["created"]
         )
 
+        # Identity is immutable, so its wire form is built once; keys travel as
+        # raw bytes (msgpack bin) rather than base64 text
+        self._wire_identity = self.identity.to_dict()
+        self._wire_identity["pubkey"] = base64.b64decode(self.identity.pubkey)
+        self._wire_identity["verify_key"] = base64.b64decode(self.identity.verify_key)
+
+        # Fresh per process, so peers can tell that this node restarted and lost
+        # its pinned peers
+        self._session = random(SESSION_ID_SIZE)
+
+        # Packed envelope up to the message body: 4-entry map header, version,
+        # sender identity, session and the "message" key, identical to packing the dict
+        self._envelope_prefix = b"\x84" + b"".join(
+            msgpack.packb(item, use_bin_type=True)
+            for item in ("version", "1.0", "sender_identity", self._wire_identity,
+                         "session", self._session, "message")
+        )
+
+        # Peers whose identity was proven by an Ed25519 signature, pinned to the
+        # first keys seen (LRU); unicast to them is authenticated with the cheaper
+        # session MAC once a KEY_ACK handshake shows they hold our key too
+        self.peers: "OrderedDict[str, _Peer]" = OrderedDict()
+
+        # Recently verified (sender, msg_id) pairs; copies relayed over another
+        # transport are dropped without re-verifying
+        self._verified: "OrderedDict[Tuple[str, str], None]" = OrderedDict()
+
         # Transport adapters
         self.transports: List[MeshTransportAdapter] = []
 
-        # Message queues
-        self.outbox = asyncio.PriorityQueue()
+        # Message queues (outbox entries: message, encoded frame)
+        self.outbox = _PriorityOutbox()
         self.inbox = asyncio.Queue()
 
         # Geospatial components
         self.current_position: Optional[Position] = None
         self.geofences: List[GeofenceZone] = []
+        self.situational_awareness = SituationalAwareness(self.database)
+        # (monotonic build time, encoded JSON, ETag) shared by all dashboard polls
+        self._tactical_picture_cache: Tuple[float, bytes, str] = (0.0, b"", "")
+        self._active_nodes_cache: Tuple[float, bytes, str] = (0.0, b"", "")
+        # Last state pushed to web clients, so only changed rows are sent; a new
+        # client is seeded with exactly this state before any later delta
+        self._dashboard_dirty = asyncio.Event()
+        self._pushed_positions: Dict[str, Dict[str, Any]] = {}
+        self._pushed_nodes: Dict[str, Dict[str, Any]] = {}
 
         # Runtime state
         self.running = False
-        self.connected_clients: set = set()
+        self.connected_clients: Dict[WebSocket, Tuple[asyncio.Queue, asyncio.Task]] = {}
+        self._inbound_tasks: set = set()
+        self._inbound_slots = asyncio.Semaphore(RX_MAX_IN_FLIGHT)
 
     async def initialize(self):
         """Initialize mesh node and transport adapters"""
@@ -628,57 +1434,184 @@ class TactiMeshNode:
     def _encode_message(self, message: TacticalMessage) -> bytes:
         """Encode and sign tactical message"""
         try:
-            # Create message envelope
-            envelope = {
-                "version": "1.0",
-                "sender_identity": asdict(self.identity),
-                "message": asdict(message)
-            }
-
-            # Serialize message
-            data = json.dumps(envelope, separators=(',', ':')).encode()
-
-            # Sign message
-            signature = self.crypto.sign_message(data)
-            envelope["message"]["signature"] = signature
+            # Serialize envelope once (only the message body is packed per call);
+            # the signature covers exactly these bytes
+            body = message.to_dict()
+            body["topic"] = TOPIC_WIRE_CODES.get(message.topic, message.topic)
+            body["classification"] = CLASSIFICATION_WIRE_CODES.get(message.classification, message.classification)
+            data = self._envelope_prefix + msgpack.packb(body, use_bin_type=True)
+
+            # Sign message (MAC only for unicast to a peer known to hold our key;
+            # the KEY_ACK handshake frame itself is what proves it to the peer)
+            peer = self.peers.get(message.recipients[0]) if len(message.recipients) == 1 else None
+            if peer is not None and (peer.mac_ready or message.msg_type == MSG_TYPE_KEY_ACK):
+                signature = self.crypto.mac_message(data, peer.identity.pubkey)
+            else:
+                signature = self.crypto.sign_message(data)
+            message.signature = signature
 
-            # Re-serialize with signature
-            return json.dumps(envelope, separators=(',', ':')).encode()
+            # Detached signature ahead of the signed bytes; nothing is re-serialized
+            return WIRE_FORMAT_MSGPACK + struct.pack('>H', len(signature)) + signature + data
 
         except Exception as e:
             logger.error(f"Message encoding failed: {e}")
             raise
 
-    def _decode_message(self, data: bytes) -> Optional[Tuple[TacticalMessage, NodeIdentity]]:
-        """Decode and verify tactical message"""
-        try:
-            envelope = json.loads(data.decode())
-
-            # Extract components
-            sender_identity = NodeIdentity(**envelope["sender_identity"])
+    def _parse_envelope(self, data: bytes) -> Optional[Tuple[bytes, bytes, NodeIdentity, Optional[bytes], Dict[str, Any]]]:
+        """Split a frame into (signed bytes, signature, sender identity, session, message fields)"""
+        # Accept legacy JSON frames from nodes that predate the msgpack format
+        if data[:1] == WIRE_FORMAT_MSGPACK:
+            # Signature is checked over the envelope bytes exactly as received
+            sig_len, = struct.unpack_from('>H', data, 1)
+            signature = data[3:3 + sig_len]
+            verify_data = data[3 + sig_len:]
+            envelope = msgpack.unpackb(verify_data, raw=False)
+            message_data = envelope["message"]
+            if isinstance(message_data["topic"], int):
+                message_data["topic"] = TOPIC_WIRE_NAMES.get(message_data["topic"], str(message_data["topic"]))
+            if isinstance(message_data["classification"], int):
+                message_data["classification"] = CLASSIFICATION_WIRE_NAMES.get(
+                    message_data["classification"], str(message_data["classification"]))
+            identity_data = dict(envelope["sender_identity"])
+            identity_data["pubkey"] = base64.b64encode(identity_data["pubkey"]).decode()
+            identity_data["verify_key"] = base64.b64encode(identity_data["verify_key"]).decode()
+            session = envelope.get("session")
+        else:
+            envelope = orjson.loads(data)
             message_data = envelope["message"]
             signature = message_data.get("signature")
+            identity_data = envelope["sender_identity"]
+            verify_data = None
+            session = None
 
-            if not signature:
-                logger.warning("Received unsigned message")
-                return None
+        if not signature:
+            logger.warning("Received unsigned message")
+            return None
 
-            # Verify signature
+        if verify_data is None:
+            # JSON frames carry the signature as base64 text inside the message,
+            # signed over the envelope with that field cleared
+            signature = base64.b64decode(signature)
             message_copy = dict(message_data)
-            message_copy.pop("signature", None)
+            message_copy["signature"] = None
             verify_envelope = {
                 "version": envelope["version"],
                 "sender_identity": envelope["sender_identity"],
                 "message": message_copy
             }
+            # Stdlib json reproduces the exact bytes older nodes signed
             verify_data = json.dumps(verify_envelope, separators=(',', ':')).encode()
 
-            if not self.crypto.verify_signature(verify_data, signature, sender_identity.verify_key):
-                logger.warning("Message signature verification failed")
+        return verify_data, signature, NodeIdentity(**identity_data), session, message_data
+
+    def _pin_peer(self, identity: NodeIdentity, session: Optional[bytes]) -> Optional[_Peer]:
+        """Remember an Ed25519-verified peer; None if its node_id is pinned to other keys"""
+        peer = self.peers.get(identity.node_id)
+        if peer is not None:
+            pinned = peer.identity
+            if pinned.pubkey != identity.pubkey or pinned.verify_key != identity.verify_key:
+                return None
+            self.peers.move_to_end(identity.node_id)
+            peer.identity = identity
+            if peer.session != session:
+                # The peer restarted and no longer holds our key; sign until it acks again
+                peer.session = session
+                peer.mac_ready = False
+                self._send_key_ack(peer)
+            return peer
+
+        peer = _Peer(identity, session)
+        self.peers[identity.node_id] = peer
+        if len(self.peers) > PEER_CACHE_SIZE:
+            self.peers.popitem(last=False)
+        self._send_key_ack(peer)
+        return peer
+
+    def _send_key_ack(self, peer: _Peer):
+        """Queue a MAC'd KEY_ACK telling the peer we hold its key in its current session"""
+        if peer.session is None:
+            return  # Legacy JSON nodes never verify MACs
+
+        message = TacticalMessage(
+            msg_id=str(uuid.uuid4()),
+            msg_type=MSG_TYPE_KEY_ACK,
+            topic=TOPIC_COMMAND,
+            sender=self.identity.node_id,
+            recipients=[peer.identity.node_id],
+            classification="UNCLASSIFIED",
+            priority=1,
+            timestamp=time.time(),
+            expires=None,
+            payload={"session": peer.session},
+            attachments=[]
+        )
+        self.outbox.put(message.priority, (message, self._encode_message(message)))
+
+    async def _decode_message(self, data: bytes) -> Optional[Tuple[TacticalMessage, NodeIdentity]]:
+        """Decode and verify tactical message"""
+        try:
+            parsed = self._parse_envelope(data)
+            if parsed is None:
+                return None
+            verify_data, signature, sender_identity, session, message_data = parsed
+
+            seen_key = (sender_identity.node_id, message_data["msg_id"])
+            if seen_key in self._verified:
+                self._verified.move_to_end(seen_key)
+                logger.debug(f"Dropping duplicate message {seen_key[1]}")
                 return None
 
+            if self.crypto.is_mac(signature):
+                # MACs are only accepted from a peer already pinned by an Ed25519
+                # signature, under the key it was pinned with
+                peer = self.peers.get(sender_identity.node_id)
+                if peer is None or peer.identity.pubkey != sender_identity.pubkey:
+                    logger.warning("Dropping MAC from a sender that is not a pinned peer")
+                    return None
+                if self.identity.node_id not in message_data["recipients"]:
+                    logger.debug("Ignoring unicast message for another node")
+                    return None
+                if not self.crypto.verify_mac(verify_data, signature, peer.identity.pubkey):
+                    logger.warning("Message MAC verification failed")
+                    return None
+                sender_identity = peer.identity
+
+                if message_data["msg_type"] == MSG_TYPE_KEY_ACK:
+                    # A valid ack proves the peer holds our key; it names our session,
+                    # so one replayed from an earlier run of this node is ignored
+                    if message_data["payload"].get("session") == self._session:
+                        confirmed = peer.mac_ready and peer.session == session
+                        peer.session = session
+                        peer.mac_ready = True
+                        if not confirmed:
+                            self._send_key_ack(peer)  # Our earlier ack may have been dropped
+                    return None
+            else:
+                # Ed25519 verification runs on the default executor to keep the loop responsive
+                verified = await asyncio.get_running_loop().run_in_executor(
+                    None, self.crypto.verify_signature, verify_data, signature, sender_identity.verify_key
+                )
+                if not verified:
+                    logger.warning("Message signature verification failed")
+                    return None
+                # Another copy may have been verified and accepted while this one awaited
+                if seen_key in self._verified:
+                    logger.debug(f"Dropping duplicate message {seen_key[1]}")
+                    return None
+                if self._pin_peer(sender_identity, session) is None:
+                    logger.warning(f"Dropping signed message from {sender_identity.node_id}: "
+                                   f"keys differ from the pinned peer")
+                    return None
+                if message_data["msg_type"] == MSG_TYPE_KEY_ACK:
+                    return None  # Handshake frames are only meaningful MAC'd
+
+            self._verified[seen_key] = None
+            if len(self._verified) > RX_DEDUP_CACHE_SIZE:
+                self._verified.popitem(last=False)
+
             # Create message object
             message = TacticalMessage(**message_data)
+            message.signature = signature
 
             # Update sender info in database
             self.database.upsert_node(sender_identity)
@@ -694,6 +1627,10 @@ class TactiMeshNode:
                           classification: str = "UNCLASSIFIED"):
         """Send tactical message"""
         try:
+            # Reject before anything is stored; the outbox needs an int priority class
+            if not isinstance(priority, int):
+                raise ValueError(f"priority must be an int, got {type(priority).__name__}")
+
             message = TacticalMessage(
                 msg_id=str(uuid.uuid4()),
                 msg_type="DATA",
@@ -708,11 +1645,14 @@ class TactiMeshNode:
                 attachments=[]
             )
 
+            # Sign and serialize once; every transport sends the same frame
+            data = self._encode_message(message)
+
             # Store message
             self.database.store_message(message)
 
             # Queue for transmission
-            await self.outbox.put((priority, message))
+            self.outbox.put(priority, (message, data))
 
             logger.info(f"Queued message {message.msg_id} for transmission")
 
@@ -740,11 +1680,12 @@ class TactiMeshNode:
 
             self.current_position = position
             self.database.upsert_position(position)
+            self.invalidate_tactical_picture()
 
             # Broadcast position update
             await self.send_message(
                 topic=TOPIC_BLUE_FORCE,
-                payload=asdict(position),
+                payload=position.to_dict(),
                 priority=2
             )
 
@@ -755,9 +1696,10 @@ class TactiMeshNode:
         """Convert lat/lon to MGRS coordinates"""
         try:
             # Simplified MGRS conversion - in production use proper library
-            zone = int((lon + 180) / 6) + 1
-            letter = chr(ord('C') + int((lat + 80) / 8))
-            return f"{zone}{letter}"
+            if not (math.isfinite(lat) and math.isfinite(lon)):
+                return ""
+            zone, letter = mgrs_grid_zone(float(lat), float(lon))
+            return f"{zone}{chr(letter)}"
         except:
             return ""
 
@@ -765,24 +1707,18 @@ class TactiMeshNode:
         """Main transmission loop"""
         while self.running:
             try:
-                # Get next message from queue
-                priority, message = await asyncio.wait_for(
-                    self.outbox.get(), timeout=1.0
-                )
-
-                # Encode message
-                data = self._encode_message(message)
+                # Get next message from queue, then drain whatever else is ready
+                batch = [await asyncio.wait_for(self.outbox.get(), timeout=1.0)]
+                while len(batch) < OUTBOX_BATCH_SIZE and not self.outbox.empty():
+                    batch.append(self.outbox.get_nowait())
 
                 # Transmit via all available transports
-                tasks = []
-                for transport in self.transports:
-                    task = asyncio.create_task(transport.send_message(data))
-                    tasks.append(task)
+                frames = [data for _, data in batch]
+                if self.transports:
+                    await asyncio.gather(*(transport.send_batch(frames) for transport in self.transports),
+                                         return_exceptions=True)
 
-                if tasks:
-                    await asyncio.gather(*tasks, return_exceptions=True)
-
-                logger.debug(f"Transmitted message {message.msg_id}")
+                logger.debug(f"Transmitted {len(batch)} message(s)")
 
             except asyncio.TimeoutError:
                 continue
@@ -791,34 +1727,64 @@ class TactiMeshNode:
                 await asyncio.sleep(0.1)
 
     async def receive_loop(self):
-        """Main reception loop"""
-        while self.running:
-            try:
-                # Check all transports for incoming messages
-                for transport in self.transports:
-                    data, sender = await transport.receive_message()
-                    if data:
-                        # Decode message
-                        result = self._decode_message(data)
-                        if result:
-                            message, sender_identity = result
-
-                            # Store message
-                            self.database.store_message(message)
+        """Main reception loop (one pending receive per transport, fanned in)"""
+        pending = {asyncio.ensure_future(transport.receive_message()): transport
+                   for transport in self.transports}
+        try:
+            while self.running and pending:
+                done, _ = await asyncio.wait(pending, timeout=1.0, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    transport = pending.pop(task)
+                    try:
+                        data, sender = task.result()
+                        if data:
+                            # Decode and dispatch without holding up the other transports;
+                            # once RX_MAX_IN_FLIGHT frames are in progress, stop re-arming
+                            # so backpressure falls back on the adapters' bounded RX queues
+                            await self._inbound_slots.acquire()
+                            handler = asyncio.ensure_future(self._handle_inbound(data))
+                            self._inbound_tasks.add(handler)
+                            handler.add_done_callback(self._inbound_done)
+
+                    except Exception as e:
+                        logger.error(f"Reception error: {e}")
+                        await asyncio.sleep(0.1)
+
+                    # Re-arm the transport that just completed (receives block until data)
+                    if getattr(transport, "running", True):
+                        pending[asyncio.ensure_future(transport.receive_message())] = transport
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _inbound_done(self, handler: asyncio.Task):
+        """Release the in-flight slot held by a finished inbound handler"""
+        self._inbound_tasks.discard(handler)
+        self._inbound_slots.release()
+
+    async def _handle_inbound(self, data: bytes):
+        """Decode, store and dispatch one received frame"""
+        try:
+            result = await self._decode_message(data)
+            if result:
+                message, sender_identity = result
+                self.invalidate_active_nodes()
 
-                            # Process special message types
-                            await self._process_received_message(message)
+                # Store message
+                self.database.store_message(message)
 
-                            # Queue for application layer
-                            await self.inbox.put((message, sender_identity))
+                # Process special message types
+                await self._process_received_message(message)
 
-                            logger.debug(f"Received message {message.msg_id}")
+                # Queue for application layer
+                await self.inbox.put((message, sender_identity))
 
-                await asyncio.sleep(0.01)
+                logger.debug(f"Received message {message.msg_id}")
 
-            except Exception as e:
-                logger.error(f"Reception error: {e}")
-                await asyncio.sleep(0.1)
+        except Exception as e:
+            logger.error(f"Reception error: {e}")
 
     async def _process_received_message(self, message: TacticalMessage):
         """Process received tactical messages"""
@@ -828,36 +1794,115 @@ class TactiMeshNode:
                 position_data = message.payload
                 position = Position(**position_data)
                 self.database.upsert_position(position)
+                self.invalidate_tactical_picture()
 
             elif message.topic == TOPIC_ALERT:
                 # Handle tactical alerts
                 logger.warning(f"TACTICAL ALERT: {message.payload}")
 
             # Broadcast to connected web clients
+            message_dict = message.to_dict()
+            message_dict["signature"] = message.signature_b64
             await self._broadcast_to_clients({
                 "type": "message",
-                "data": asdict(message)
+                "data": message_dict
             })
 
         except Exception as e:
             logger.error(f"Message processing error: {e}")
 
+    def get_tactical_picture_json(self) -> Tuple[bytes, str]:
+        """Encoded tactical picture and ETag, rebuilt at most once per TACTICAL_PICTURE_TTL"""
+        built, encoded, etag = self._tactical_picture_cache
+        now = time.monotonic()
+        if not encoded or now - built >= TACTICAL_PICTURE_TTL:
+            encoded, etag = self.situational_awareness.get_tactical_picture_json()
+            self._tactical_picture_cache = (now, encoded, etag)
+        return encoded, etag
+
+    def invalidate_tactical_picture(self):
+        """Force the next tactical picture request to rebuild"""
+        self._tactical_picture_cache = (0.0, b"", "")
+        self._dashboard_dirty.set()
+
+    def get_active_nodes_json(self) -> Tuple[bytes, str]:
+        """Encoded active node list and ETag, rebuilt at most once per ACTIVE_NODES_TTL"""
+        built, encoded, etag = self._active_nodes_cache
+        now = time.monotonic()
+        if not encoded or now - built >= ACTIVE_NODES_TTL:
+            # orjson encodes the dataclasses natively, with no intermediate dicts
+            encoded = orjson.dumps(self.database.get_active_nodes())
+            etag = _etag(encoded)
+            self._active_nodes_cache = (now, encoded, etag)
+        return encoded, etag
+
+    def invalidate_active_nodes(self):
+        """Force the next active node list request to rebuild"""
+        self._active_nodes_cache = (0.0, b"", "")
+        self._dashboard_dirty.set()
+
+    def add_client(self, websocket: WebSocket):
+        """Register a web client with its own bounded send queue and relay task"""
+        if not self.connected_clients:
+            # Nobody holds the last pushed state; start over so the next push is complete
+            self._pushed_positions = {}
+            self._pushed_nodes = {}
+
+        # Seed the client's queue with the state later deltas are relative to, so a
+        # delta can never be applied to an older snapshot
+        queue: asyncio.Queue = asyncio.Queue(maxsize=WS_CLIENT_QUEUE_SIZE)
+        queue.put_nowait(_ws_packer.pack({
+            "type": "tactical_picture",
+            "data": {"features": list(self._pushed_positions.values()), "removed": []}
+        }))
+        queue.put_nowait(_ws_packer.pack({
+            "type": "nodes",
+            "data": {"nodes": list(self._pushed_nodes.values()), "removed": []}
+        }))
+        relay = asyncio.ensure_future(self._relay_to_client(websocket, queue))
+        self.connected_clients[websocket] = (queue, relay)
+        self._dashboard_dirty.set()
+
+    def remove_client(self, websocket: WebSocket, close: bool = False):
+        """Unregister a web client, optionally closing its socket"""
+        entry = self.connected_clients.pop(websocket, None)
+        if entry is None:
+            return
+        entry[1].cancel()
+        if close:
+            asyncio.ensure_future(websocket.close(code=1013))
+
+    async def _relay_to_client(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain one client's queue; a failed or stalled send drops that client only"""
+        while True:
+            message = await queue.get()
+            try:
+                await asyncio.wait_for(websocket.send_bytes(message), timeout=WS_SEND_TIMEOUT)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.connected_clients.pop(websocket, None)
+                asyncio.ensure_future(websocket.close(code=1013))
+                return
+
     async def _broadcast_to_clients(self, data: Dict[str, Any]):
         """Broadcast data to connected web clients"""
         if not self.connected_clients:
             return
 
-        message = json.dumps(data)
-        disconnected = set()
-
-        for websocket in self.connected_clients.copy():
+        # Serialize once and enqueue without awaiting any client
+        message = _ws_packer.pack(data)
+        overflowed = []
+        for websocket, (queue, _) in self.connected_clients.items():
             try:
-                await websocket.send_text(message)
-            except:
-                disconnected.add(websocket)
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                overflowed.append(websocket)
 
-        # Remove disconnected clients
-        self.connected_clients -= disconnected
+        # Clients that fell a full queue behind are disconnected
+        for websocket in overflowed:
+            logger.warning("Dropping web client that is not keeping up")
+            self.remove_client(websocket, close=True)
 
     async def start(self):
         """Start mesh node operations"""
@@ -869,6 +1914,8 @@ class TactiMeshNode:
         # Start background tasks
         asyncio.create_task(self.transmit_loop())
         asyncio.create_task(self.receive_loop())
+        asyncio.create_task(self._db_flush_loop())
+        asyncio.create_task(self._dashboard_push_loop())
 
         # Start position updates if GPS available
         if self.config.get("gps_enabled", False):
@@ -877,6 +1924,59 @@ class TactiMeshNode:
         logger.info(f"TactiMesh node started: {self.identity.callsign}")
         return True
 
+    async def _db_flush_loop(self):
+        """Periodic flush of buffered database writes"""
+        while self.running:
+            await asyncio.sleep(DB_FLUSH_INTERVAL)
+            try:
+                self.database.flush()
+            except Exception as e:
+                logger.error(f"Database flush error: {e}")
+
+    async def _dashboard_push_loop(self):
+        """Push tactical picture and node list changes to web clients"""
+        while self.running:
+            try:
+                await asyncio.wait_for(self._dashboard_dirty.wait(), timeout=DASHBOARD_PUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._dashboard_dirty.clear()
+
+            if not self.connected_clients:
+                continue
+            try:
+                await self._push_dashboard_deltas()
+            except Exception as e:
+                logger.error(f"Dashboard push error: {e}")
+
+            # Coalesce bursts of updates into at most one push per TTL
+            await asyncio.sleep(TACTICAL_PICTURE_TTL)
+
+    async def _push_dashboard_deltas(self):
+        """Broadcast positions and nodes that changed or expired since the last push"""
+        picture = self.situational_awareness.get_tactical_picture()
+        features = {feature['properties']['node_id']: feature for feature in picture['features']}
+        changed = [feature for node_id, feature in features.items()
+                   if node_id not in self._pushed_positions
+                   or self._pushed_positions[node_id]['properties']['timestamp'] != feature['properties']['timestamp']]
+        removed = [node_id for node_id in self._pushed_positions if node_id not in features]
+        if changed or removed:
+            self._pushed_positions = features
+            await self._broadcast_to_clients({
+                "type": "tactical_picture",
+                "data": {"features": changed, "removed": removed}
+            })
+
+        nodes = {node.node_id: node.to_dict() for node in self.database.get_active_nodes()}
+        changed = [node for node_id, node in nodes.items() if self._pushed_nodes.get(node_id) != node]
+        removed = [node_id for node_id in self._pushed_nodes if node_id not in nodes]
+        if changed or removed:
+            self._pushed_nodes = nodes
+            await self._broadcast_to_clients({
+                "type": "nodes",
+                "data": {"nodes": changed, "removed": removed}
+            })
+
     async def _gps_update_loop(self):
         """Periodic GPS position updates"""
         while self.running:
@@ -901,6 +2001,28 @@ class TactiMeshNode:
 # SITUATIONAL AWARENESS ENGINE
 # =============================================================================
 
+_FEATURE_COLUMNS = ('node_id', 'lat', 'lon', 'alt', 'speed', 'course', 'timestamp')
+
+def _position_feature(node_id: str, lat: float, lon: float, alt: float, speed: float,
+                      course: float, timestamp: float) -> Dict[str, Any]:
+    """GeoJSON point feature for one node position"""
+    return {
+        'type': 'Feature',
+        'properties': {
+            'node_id': node_id,
+            'lat': lat,
+            'lon': lon,
+            'alt': alt,
+            'speed': speed,
+            'course': course,
+            'timestamp': timestamp
+        },
+        'geometry': {
+            'type': 'Point',
+            'coordinates': [lon, lat]
+        }
+    }
+
 class SituationalAwareness:
     """Geospatial intelligence and mapping engine"""
 
@@ -908,96 +2030,117 @@ class SituationalAwareness:
         self.database = database
         self.offline_maps: Dict[str, Any] = {}
 
+        # Restricted zones parsed once and indexed for bulk point queries
+        self._geofence_rows: List[tuple] = []
+        self._geofence_tree: Optional[shapely.STRtree] = None
+        self._geofences_loaded = 0.0
+        self.reload_geofences()
+
+        # node_id -> (position row, encoded GeoJSON feature) from the last encode
+        self._feature_cache: Dict[str, Tuple[tuple, bytes]] = {}
+
+    def reload_geofences(self):
+        """Load active restricted zones and rebuild the spatial index"""
+        self._geofences_loaded = time.monotonic()
+        try:
+            rows = self.database.get_restricted_geofences()
+            self._geofence_rows = rows
+            self._geofence_tree = shapely.STRtree(shapely.from_wkt([row[3] for row in rows])) if rows else None
+
+        except Exception as e:
+            logger.error(f"Failed to load geofences: {e}")
+
     def get_tactical_picture(self, bbox: Optional[Tuple[float, float, float, float]] = None) -> Dict[str, Any]:
         """Generate current tactical situation picture"""
         try:
-            # Get current positions
-            positions = self.database.get_current_positions()
-
-            # Convert to GeoDataFrame
-            if positions:
-                pos_data = []
-                for pos in positions:
-                    pos_data.append({
-                        'node_id': pos.node_id,
-                        'lat': pos.lat,
-                        'lon': pos.lon,
-                        'alt': pos.alt,
-                        'speed': pos.speed,
-                        'course': pos.course,
-                        'timestamp': pos.timestamp,
-                        'geometry': Point(pos.lon, pos.lat)
-                    })
-
-                gdf = gpd.GeoDataFrame(pos_data)
-
-                # Filter by bounding box if provided
-                if bbox:
-                    minx, miny, maxx, maxy = bbox
-                    bbox_poly = Polygon([(minx, miny), (minx, maxy), (maxx, maxy), (maxx, miny)])
-                    gdf = gdf[gdf.geometry.within(bbox_poly)]
-
-                # Convert back to serializable format
-                features = []
-                for _, row in gdf.iterrows():
-                    features.append({
-                        'type': 'Feature',
-                        'properties': {
-                            'node_id': row['node_id'],
-                            'lat': row['lat'],
-                            'lon': row['lon'],
-                            'alt': row['alt'],
-                            'speed': row['speed'],
-                            'course': row['course'],
-                            'timestamp': row['timestamp']
-                        },
-                        'geometry': {
-                            'type': 'Point',
-                            'coordinates': [row['lon'], row['lat']]
-                        }
-                    })
-
-                return {
-                    'type': 'FeatureCollection',
-                    'features': features,
-                    'timestamp': time.time()
-                }
-
-            return {'type': 'FeatureCollection', 'features': [], 'timestamp': time.time()}
+            # Get current positions as column arrays
+            soa = self.database.get_current_positions_soa()
+
+            # Filter by bounding box if provided
+            if bbox:
+                minx, miny, maxx, maxy = bbox
+                lat, lon = soa['lat'], soa['lon']
+                mask = (lon >= minx) & (lon <= maxx) & (lat >= miny) & (lat <= maxy)
+                soa = {name: column[mask] for name, column in soa.items()}
+
+            # Convert to serializable format
+            columns = (soa[name].tolist() for name in _FEATURE_COLUMNS)
+            features = [_position_feature(*row) for row in zip(*columns)]
+
+            return {
+                'type': 'FeatureCollection',
+                'features': features,
+                'timestamp': time.time()
+            }
 
         except Exception as e:
             logger.error(f"Failed to generate tactical picture: {e}")
             return {'type': 'FeatureCollection', 'features': [], 'timestamp': time.time()}
 
-    def check_geofence_violations(self, position: Position) -> List[str]:
+    def get_tactical_picture_json(self) -> Tuple[bytes, str]:
+        """Encoded tactical picture and ETag; a node's feature is re-encoded only when its position changes"""
+        try:
+            soa = self.database.get_current_positions_soa()
+            columns = (soa[name].tolist() for name in _FEATURE_COLUMNS)
+
+            # Rebuilding the cache from current rows also drops expired nodes
+            cache = self._feature_cache
+            encoded: Dict[str, Tuple[tuple, bytes]] = {}
+            for row in zip(*columns):
+                entry = cache.get(row[0])
+                if entry is None or entry[0] != row:
+                    entry = (row, orjson.dumps(_position_feature(*row)))
+                encoded[row[0]] = entry
+            self._feature_cache = encoded
+
+            # The ETag covers the features only, so it is stable while nothing
+            # moves; the envelope timestamp still changes, hence a weak tag
+            features = b",".join(feature for _, feature in encoded.values())
+            return b"".join((
+                b'{"type":"FeatureCollection","features":[', features,
+                b'],"timestamp":', orjson.dumps(time.time()), b"}"
+            )), _etag(features, weak=True)
+
+        except Exception as e:
+            logger.error(f"Failed to encode tactical picture: {e}")
+            return orjson.dumps({'type': 'FeatureCollection', 'features': [], 'timestamp': time.time()}), _etag(b"", weak=True)
+
+    def get_proximity_matrix(self, max_age_seconds: int = 300) -> Tuple[List[str], np.ndarray]:
+        """Get pairwise distances (km) between current node positions"""
+        soa = self.database.get_current_positions_soa(max_age_seconds)
+        return soa['node_id'].tolist(), haversine_matrix(soa['lat'], soa['lon'])
+
+    def check_geofence_violations(self, position: Position) -> List[Dict[str, Any]]:
         """Check for geofence violations"""
-        violations = []
+        return self.check_geofence_violations_batch([position]).get(position.node_id, [])
+
+    def check_geofence_violations_batch(self, positions: List[Position]) -> Dict[str, List[Dict[str, Any]]]:
+        """Check many positions against all restricted geofences in one vectorized pass"""
+        violations: Dict[str, List[Dict[str, Any]]] = {}
+        if not positions:
+            return violations
+
+        if time.monotonic() - self._geofences_loaded > GEOFENCE_RELOAD_INTERVAL:
+            self.reload_geofences()
+
         try:
-            point = Point(position.lon, position.lat)
-
-            # Check against all active geofences
-            with sqlite3.connect(self.database.db_path) as conn:
-                cursor = conn.execute("""
-                    SELECT zone_id, name, zone_type, polygon, classification
-                    FROM geofences 
-                    WHERE active = TRUE
-                """)
-
-                for row in cursor.fetchall():
-                    zone_id, name, zone_type, polygon_wkt, classification = row
-
-                    # Parse WKT polygon
-                    from shapely import wkt
-                    polygon = wkt.loads(polygon_wkt)
-
-                    # Check if position is within restricted zone
-                    if zone_type in ["HOSTILE", "RESTRICTED"] and polygon.contains(point):
-                        violations.append({
-                            'zone_id': zone_id,
-                            'name': name,
-                            'type': zone_type,
-                            'classification': classification
-                        })
+            if self._geofence_tree is None:
+                return violations
+
+            lon = np.fromiter((pos.lon for pos in positions), dtype=np.float64, count=len(positions))
+            lat = np.fromiter((pos.lat for pos in positions), dtype=np.float64, count=len(positions))
+            points = shapely.points(lon, lat)
+
+            # Single bulk tree query: (position index, zone index) for every point inside a zone
+            point_idx, zone_idx = self._geofence_tree.query(points, predicate='within')
+            for idx, zone in zip(point_idx.tolist(), zone_idx.tolist()):
+                zone_id, name, zone_type, _, classification = self._geofence_rows[zone]
+                violations.setdefault(positions[idx].node_id, []).append({
+                    'zone_id': zone_id,
+                    'name': name,
+                    'type': zone_type,
+                    'classification': classification
+                })
 
         except Exception as e:
             logger.error(f"Geofence check failed: {e}")
@@ -1015,7 +2158,8 @@ mesh_node: Optional[TactiMeshNode] = None
 app = FastAPI(
     title="TactiMesh",
     description="Real-Time Military Mesh Networking & Situational Awareness Platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -1065,18 +2209,34 @@ async def startup():
     else:
         logger.error("Failed to start TactiMesh application")
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Application shutdown"""
+    if mesh_node:
+        mesh_node.database.close()
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time communication"""
     await websocket.accept()
 
     if mesh_node:
-        mesh_node.connected_clients.add(websocket)
+        mesh_node.add_client(websocket)
 
         try:
             while True:
-                # Handle incoming WebSocket messages
-                data = await websocket.receive_json()
+                # Handle incoming WebSocket messages; a bad frame is skipped, not fatal
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    break
+                try:
+                    data = msgpack.unpackb(frame["bytes"], raw=False)
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Ignoring malformed WebSocket frame: {e!r}")
+                    continue
+                if not isinstance(data, dict):
+                    logger.warning("Ignoring WebSocket frame that is not a map")
+                    continue
                 message_type = data.get("type")
 
                 if message_type == "send_message":
@@ -1094,85 +2254,89 @@ async def websocket_endpoint(websocket: WebSocket):
                     )
 
         except WebSocketDisconnect:
-            if mesh_node:
-                mesh_node.connected_clients.discard(websocket)
+            pass
+        finally:
+            # Any exit, not only a clean disconnect, must stop the client's relay task
+            mesh_node.remove_client(websocket)
+
+def _conditional_json(request: Request, body: bytes, etag: str) -> Response:
+    """Pre-encoded JSON response, or 304 when the client already holds this ETag"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 @app.get("/api/tactical-picture")
-async def get_tactical_picture():
+async def get_tactical_picture(request: Request):
     """Get current tactical situation picture"""
     if not mesh_node:
         raise HTTPException(status_code=503, detail="Mesh node not initialized")
 
-    sa_engine = SituationalAwareness(mesh_node.database)
-    return sa_engine.get_tactical_picture()
+    return _conditional_json(request, *mesh_node.get_tactical_picture_json())
 
 @app.get("/api/nodes")
-async def get_active_nodes():
+async def get_active_nodes(request: Request):
     """Get list of active mesh nodes"""
     if not mesh_node:
         raise HTTPException(status_code=503, detail="Mesh node not initialized")
 
-    nodes = mesh_node.database.get_active_nodes()
-    return [asdict(node) for node in nodes]
+    return _conditional_json(request, *mesh_node.get_active_nodes_json())
+
+def _stream_json_array(batches):
+    """Encode batches of dicts as one JSON array, one chunk per batch"""
+    yield b"["
+    separator = b""
+    for batch in batches:
+        yield separator + b",".join(orjson.dumps(item) for item in batch)
+        separator = b","
+    yield b"]"
 
 @app.get("/api/messages")
-async def get_messages(topic: Optional[str] = None, limit: int = 100):
-    """Get tactical messages"""
+async def get_messages(topic: Optional[str] = None, limit: int = 100, fields: Optional[str] = None):
+    """Get tactical messages (fields=short for headers only)"""
     if not mesh_node:
         raise HTTPException(status_code=503, detail="Mesh node not initialized")
 
-    with sqlite3.connect(mesh_node.database.db_path) as conn:
-        if topic:
-            cursor = conn.execute("""
-                SELECT msg_id, msg_type, topic, sender, recipients, classification, 
-                       priority, timestamp, payload, attachments
-                FROM messages 
-                WHERE topic = ?
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            """, (topic, limit))
-        else:
-            cursor = conn.execute("""
-                SELECT msg_id, msg_type, topic, sender, recipients, classification,
-                       priority, timestamp, payload, attachments
-                FROM messages 
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            """, (limit,))
-
-        messages = []
-        for row in cursor.fetchall():
-            messages.append({
-                'msg_id': row[0],
-                'msg_type': row[1],
-                'topic': row[2],
-                'sender': row[3],
-                'recipients': json.loads(row[4]),
-                'classification': row[5],
-                'priority': row[6],
-                'timestamp': row[7],
-                'payload': json.loads(row[8]),
-                'attachments': json.loads(row[9]) if row[9] else []
-            })
+    if fields == "short":
+        return ORJSONResponse(mesh_node.database.get_message_summaries(topic, limit))
+    if fields is not None:
+        raise HTTPException(status_code=400, detail=f"Unsupported fields value: {fields}")
+
+    # Large audit dumps are encoded batch by batch instead of as one list
+    if limit > MESSAGES_STREAM_THRESHOLD:
+        return StreamingResponse(_stream_json_array(mesh_node.database.iter_message_batches(topic, limit)),
+                                 media_type="application/json")
 
-        return messages
+    messages = mesh_node.database.get_messages(topic, limit)
+
+    # Returned directly so FastAPI skips its jsonable_encoder pass
+    return ORJSONResponse(messages)
 
 @app.post("/api/messages")
-async def send_message(
-    topic: str = Form(...),
-    payload: str = Form(...),
-    priority: int = Form(2),
-    classification: str = Form("UNCLASSIFIED")
-):
-    """Send tactical message"""
+async def send_message(request: Request):
+    """Send tactical message (msgpack or JSON body)"""
     if not mesh_node:
         raise HTTPException(status_code=503, detail="Mesh node not initialized")
 
+    body = await request.body()
     try:
-        payload_dict = json.loads(payload)
+        # Decode the structured body once; no form parsing or nested JSON string
+        if "msgpack" in request.headers.get("content-type", ""):
+            evt = msgpack.unpackb(body, raw=False)
+        else:
+            evt = orjson.loads(body)
+
+        topic = evt["topic"]
+        payload = evt["payload"]
+        priority = evt.get("priority", 2)
+        classification = evt.get("classification", "UNCLASSIFIED")
+        if not (isinstance(topic, str) and isinstance(payload, dict)
+                and isinstance(priority, int) and isinstance(classification, str)):
+            raise ValueError("expected topic: str, payload: object, priority: int, classification: str")
+
         await mesh_node.send_message(
             topic=topic,
-            payload=payload_dict,
+            payload=payload,
             priority=priority,
             classification=classification
         )
@@ -1181,11 +2345,8 @@ async def send_message(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to send message: {e}")
 
-# Serve static web interface
-@app.get("/")
-async def get_interface():
-    """Serve tactical web interface"""
-    html_content = """
+# Serve static web interface (static, so encoded and compressed once at import)
+_INDEX_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -1262,6 +2423,7 @@ async def get_interface():
         </div>
 
         <script src="https://unpkg.com/leaflet/dist/leaflet.js"></script>
+        <script src="https://unpkg.com/@msgpack/msgpack/dist.es5+umd/msgpack.min.js"></script>
         <script>
             // Initialize map
             const map = L.map('map').setView([37.7749, -122.4194], 12);
@@ -1271,19 +2433,26 @@ async def get_interface():
 
             // WebSocket connection
             const ws = new WebSocket(`ws://${window.location.host}/ws`);
+            ws.binaryType = 'arraybuffer';
             let nodeMarkers = {};
+            let nodesById = {};
             let messageCount = 0;
 
             ws.onopen = function() {
+                // The server sends the full state first, then deltas over the same socket
                 document.getElementById('status').textContent = 'CONNECTED';
                 document.getElementById('status').style.color = '#00ff00';
             };
 
             ws.onmessage = function(event) {
-                const data = JSON.parse(event.data);
+                const data = MessagePack.decode(new Uint8Array(event.data));
 
                 if (data.type === 'message') {
                     handleMessage(data.data);
+                } else if (data.type === 'tactical_picture') {
+                    updateMap(data.data);
+                } else if (data.type === 'nodes') {
+                    updateNodeList(data.data);
                 }
 
                 updateDisplay();
@@ -1305,11 +2474,24 @@ async def get_interface():
                 messageDiv.style.border = '1px solid #555';
 
                 const timestamp = new Date(message.timestamp * 1000).toLocaleString();
-                messageDiv.innerHTML = `
-                    <strong>[${message.topic.toUpperCase()}]</strong> ${message.sender}<br>
-                    <small>${timestamp} - Priority: ${message.priority}</small><br>
-                    ${JSON.stringify(message.payload)}
-                `;
+                const header = document.createElement('strong');
+                header.textContent = `[${message.topic.toUpperCase()}]`;
+                const meta = document.createElement('small');
+                meta.textContent = `${timestamp} - Priority: ${message.priority}`;
+
+                // Payload is only serialized if the operator expands it
+                const details = document.createElement('details');
+                const summary = document.createElement('summary');
+                summary.textContent = 'Payload';
+                const pre = document.createElement('pre');
+                details.append(summary, pre);
+                details.addEventListener('toggle', function() {
+                    if (details.open && !pre.textContent) {
+                        pre.textContent = JSON.stringify(message.payload, null, 2);
+                    }
+                });
+
+                messageDiv.append(header, ` ${message.sender}`, document.createElement('br'), meta, details);
 
                 messageArea.appendChild(messageDiv);
                 messageArea.scrollTop = messageArea.scrollHeight;
@@ -1319,33 +2501,23 @@ async def get_interface():
                 // Update network stats
                 const stats = document.getElementById('networkStats');
                 stats.textContent = `Nodes: ${Object.keys(nodeMarkers).length} | Messages: ${messageCount} | Last Update: ${new Date().toLocaleString()}`;
+            }
 
-                // Fetch tactical picture
-                fetch('/api/tactical-picture')
-                    .then(response => response.json())
-                    .then(data => {
-                        updateMap(data);
-                    })
-                    .catch(error => console.error('Error fetching tactical picture:', error));
-
-                // Fetch active nodes
-                fetch('/api/nodes')
-                    .then(response => response.json())
-                    .then(nodes => {
-                        updateNodeList(nodes);
-                    })
-                    .catch(error => console.error('Error fetching nodes:', error));
+            function removeMarker(nodeId) {
+                if (nodeMarkers[nodeId]) {
+                    map.removeLayer(nodeMarkers[nodeId]);
+                    delete nodeMarkers[nodeId];
+                }
             }
 
-            function updateMap(tacticalPicture) {
-                // Clear existing markers
-                Object.values(nodeMarkers).forEach(marker => map.removeLayer(marker));
-                nodeMarkers = {};
+            function updateMap(delta) {
+                // Drop expired nodes, then replace markers for moved ones
+                delta.removed.forEach(removeMarker);
 
-                // Add new markers
-                tacticalPicture.features.forEach(feature => {
+                delta.features.forEach(feature => {
                     const props = feature.properties;
                     const coords = feature.geometry.coordinates;
+                    removeMarker(props.node_id);
 
                     const marker = L.marker([coords[1], coords[0]], {
                         title: props.node_id
@@ -1363,8 +2535,12 @@ async def get_interface():
                 });
             }
 
-            function updateNodeList(nodes) {
+            function updateNodeList(delta) {
+                delta.removed.forEach(nodeId => delete nodesById[nodeId]);
+                delta.nodes.forEach(node => { nodesById[node.node_id] = node; });
+
                 const nodeList = document.getElementById('nodeList');
+                const nodes = Object.values(nodesById);
 
                 if (nodes.length === 0) {
                     nodeList.innerHTML = 'No active nodes';
@@ -1390,7 +2566,7 @@ async def get_interface():
 
                 if (!text.trim()) return;
 
-                ws.send(JSON.stringify({
+                ws.send(MessagePack.encode({
                     type: 'send_message',
                     topic: topic,
                     payload: { text: text },
@@ -1410,7 +2586,7 @@ async def get_interface():
 
                 if (isNaN(lat) || isNaN(lon)) return;
 
-                ws.send(JSON.stringify({
+                ws.send(MessagePack.encode({
                     type: 'update_position',
                     lat: lat,
                     lon: lon,
@@ -1422,17 +2598,40 @@ async def get_interface():
                 document.getElementById('lonInput').value = '';
                 document.getElementById('altInput').value = '';
             });
-
-            // Update display every 5 seconds
-            setInterval(updateDisplay, 5000);
-
-            // Initial update
-            setTimeout(updateDisplay, 1000);
         </script>
     </body>
     </html>
-    """
-    return HTMLResponse(content=html_content)
+    """.encode("utf-8")
+_INDEX_HEADERS = {"Cache-Control": "public, max-age=60", "Vary": "Accept-Encoding"}
+_INDEX_RESPONSE = HTMLResponse(content=_INDEX_HTML, headers=_INDEX_HEADERS)
+_INDEX_RESPONSE_GZ = HTMLResponse(content=gzip.compress(_INDEX_HTML, 6),
+                                  headers={**_INDEX_HEADERS, "Content-Encoding": "gzip"})
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether Accept-Encoding allows gzip, honouring q-values (q=0 means refused)"""
+    qvalues = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.strip().lower()] = q
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qvalues:
+            return qvalues[coding] > 0
+    return False
+
+@app.get("/")
+async def get_interface(request: Request):
+    """Serve tactical web interface"""
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return _INDEX_RESPONSE_GZ
+    return _INDEX_RESPONSE
 
 # =============================================================================
 # MAIN APPLICATION ENTRY POINT
@@ -1443,16 +2642,31 @@ if __name__ == "__main__":
     print("=" * 80)
     print("Starting production deployment...")
 
-    # Configure logging for production
+    # Configure logging for production; file and console writes happen on the
+    # listener thread so logging never blocks the event loop
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    log_handlers = [
+        logging.FileHandler(LOGS_DIR / 'tactimesh.log'),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in log_handlers:
+        handler.setFormatter(log_formatter)
+    log_queue = SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, *log_handlers)
+    log_listener.start()
+    # force=True: the import-time basicConfig already attached the synchronous handlers.
+    # The queue side keeps the bare message; the listener's handlers apply log_formatter.
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(LOGS_DIR / 'tactimesh.log'),
-            logging.StreamHandler(sys.stdout)
-        ]
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True
     )
 
+    # Run the mesh and web loops on libuv when available
+    if UVLOOP_AVAILABLE:
+        logger.info("Using uvloop event loop")
+
     try:
         # Start FastAPI server
         uvicorn.run(
@@ -1460,11 +2674,19 @@ if __name__ == "__main__":
             host="0.0.0.0",
             port=8000,
             log_level="info",
-            access_log=True,
+            loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+            http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
+            ws="websockets",
+            ws_max_size=WS_MAX_FRAME_SIZE,
+            ws_per_message_deflate=False,  # msgpack frames are small; skip per-frame zlib
+            access_log=False,  # Per-request log lines are measurable under load
+            workers=1,  # One process is one mesh node (identity, radio, peer state)
             reload=False  # Production mode
         )
     except KeyboardInterrupt:
         logger.info("TactiMesh shutdown requested")
     except Exception as e:
         logger.error(f"TactiMesh startup failed: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        log_listener.stop()
\ No newline at end of file